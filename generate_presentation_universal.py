@@ -9,6 +9,8 @@ import sys
 import os
 import json
 import re
+import functools
+from copy import deepcopy
 from pathlib import Path
 from pptx import Presentation
 from pptx.util import Inches, Pt
@@ -39,18 +41,21 @@ DEFAULT_CONFIG = {
 
 def merge_config(user_config, defaults=DEFAULT_CONFIG):
     """Merge user config with defaults"""
-    config = defaults.copy()
-    if user_config:
-        config.update(user_config)
-        # Merge nested styles
-        if "styles" in user_config:
-            config["styles"] = {**defaults["styles"], **user_config["styles"]}
+    if not user_config:
+        return defaults.copy()
+    
+    config = {**defaults, **user_config}
+    # Merge nested styles
+    if "styles" in user_config:
+        config["styles"] = {**defaults["styles"], **user_config["styles"]}
     return config
 
 
 # === OVERFLOW DETECTION ===
+# typed=True keeps Length (EMU) and plain-inch arguments in separate entries
+@functools.lru_cache(maxsize=2048, typed=True)
 def check_text_overflow(text, font_size, width_inches, height_inches):
-    """Estimates if text will overflow"""
+    """Estimates if text will overflow (memoized; see cache_clear())"""
     if hasattr(width_inches, 'inches'):
         width_inches = width_inches.inches
     if hasattr(height_inches, 'inches'):
@@ -59,17 +64,19 @@ def check_text_overflow(text, font_size, width_inches, height_inches):
     chars_per_inch = 72 / font_size * 2.5
     chars_per_line = int(width_inches * chars_per_inch)
     
-    words = text.split()
-    current_line_length = 0
     lines_needed = 1
     
-    for word in words:
-        word_length = len(word) + 1
-        if current_line_length + word_length > chars_per_line:
-            lines_needed += 1
-            current_line_length = word_length
-        else:
-            current_line_length += word_length
+    # Words plus one separator each can never exceed len(text) + 1, so
+    # text that short fits on a single line without walking the words
+    if len(text) + 1 > chars_per_line:
+        current_line_length = 0
+        for word_length in map(len, text.split()):
+            word_length += 1
+            if current_line_length + word_length > chars_per_line:
+                lines_needed += 1
+                current_line_length = word_length
+            else:
+                current_line_length += word_length
     
     line_height = font_size / 72 * 1.3
     lines_available = int(height_inches / line_height)
@@ -79,28 +86,72 @@ def check_text_overflow(text, font_size, width_inches, height_inches):
 
 
 # === LIST DETECTION ===
+# Applied in order, so "- 1. text" loses both markers
+_BULLET_MARKER_PATTERNS = tuple(re.compile(p) for p in (
+    r'^\s*[•\-\*]\s*', r'^\s*\d+\.\s*', r'^\s*[a-z]\)\s*'
+))
+
+
+def is_list_line(line):
+    """Check if a line starts with a bullet (•, -, *) or a 1. / a) / A. marker"""
+    text = line.lstrip()
+    if not text:
+        return False
+    
+    first = text[0]
+    if first in '•-*':
+        return True
+    if first.isdecimal():
+        dot = text.find('.')
+        return dot > 0 and text[:dot].isdecimal()
+    if 'a' <= first <= 'z':
+        return text[1:2] == ')'
+    if 'A' <= first <= 'Z':
+        return text[1:2] == '.'
+    return False
+
+
 def is_list_content(lines):
     """Detect if content should be formatted as a list"""
     if not lines:
         return False
     
-    bullet_patterns = [r'^\s*[•\-\*]', r'^\s*\d+\.', r'^\s*[a-z]\)', r'^\s*[A-Z]\.']
-    matching = sum(1 for line in lines if any(re.match(p, line) for p in bullet_patterns))
-    return matching >= len(lines) * 0.5
+    total = len(lines)
+    needed = total * 0.5
+    matching = 0
+    
+    # Stop as soon as the 50% threshold is reached or can no longer be
+    for seen, line in enumerate(lines, start=1):
+        if is_list_line(line):
+            matching += 1
+            if matching >= needed:
+                return True
+        elif seen - matching > total - needed:
+            return False
+    return matching >= needed
 
 
 def clean_bullet_marker(text):
     """Remove common bullet markers from text"""
-    text = re.sub(r'^\s*[•\-\*]\s*', '', text)
-    text = re.sub(r'^\s*\d+\.\s*', '', text)
-    text = re.sub(r'^\s*[a-z]\)\s*', '', text)
+    for pattern in _BULLET_MARKER_PATTERNS:
+        text = pattern.sub('', text)
     return text
 
 
 # === QUESTION SPLITTING ===
+_QUESTION_SPLIT_RE = re.compile(r'\?\s*(?=\d+\.|\b[A-Z])')
+
+
 def split_questions(text):
     """Robustly split multiple questions"""
-    questions = re.split(r'\?\s*(?=\d+\.|\b[A-Z])', text)
+    stripped = text.strip()
+    if '?' not in stripped[:-1]:
+        # At most a trailing '?': a single question, no split point
+        if not stripped:
+            return [text]
+        return [stripped if stripped.endswith('?') else stripped + '?']
+    
+    questions = _QUESTION_SPLIT_RE.split(text)
     result = []
     
     for q in questions:
@@ -114,6 +165,15 @@ def split_questions(text):
 
 
 # === STYLE APPLICATION ===
+_STYLE_TAG_RE = re.compile(r'^\[(\w+)\]\s*(.+)')
+
+
+@functools.lru_cache(maxsize=64)
+def rgb_color(r, g, b):
+    """Shared RGBColor for a config color (RGBColor is immutable)"""
+    return RGBColor(r, g, b)
+
+
 def apply_style(paragraph, style_name, config):
     """Apply predefined style to a paragraph"""
     styles = config.get("styles", {})
@@ -124,7 +184,7 @@ def apply_style(paragraph, style_name, config):
         
         if "color" in style:
             color = style["color"]
-            paragraph.font.color.rgb = RGBColor(*color)
+            paragraph.font.color.rgb = rgb_color(*color)
         
         paragraph.font.bold = style.get("bold", False)
         paragraph.font.italic = style.get("italic", False)
@@ -132,35 +192,51 @@ def apply_style(paragraph, style_name, config):
 
 def parse_styled_text(text):
     """Parse text with inline style markers"""
-    match = re.match(r'^\[(\w+)\]\s*(.+)', text)
+    match = _STYLE_TAG_RE.match(text)
     if match:
         return match.group(1), match.group(2)
     return None, text
 
 
 # === MATH/SPECIAL CHARACTERS ===
+_SUPERSCRIPTS = {'0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
+                 '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹'}
+_SUBSCRIPTS = {'0': '₀', '1': '₁', '2': '₂', '3': '₃', '4': '₄',
+               '5': '₅', '6': '₆', '7': '₇', '8': '₈', '9': '₉'}
+_MATH_SYMBOLS = {
+    '<=': '≤', '>=': '≥', '!=': '≠', '~=': '≈',
+    'alpha': 'α', 'beta': 'β', 'gamma': 'γ', 'delta': 'δ',
+    'pi': 'π', 'theta': 'θ', 'sigma': 'σ'
+}
+
+# ^d -> superscript digit, _d -> subscript digit
+_SCRIPT_RE = re.compile(r'([\^_])(\d)')
+_SCRIPT_DIGITS = {'^': _SUPERSCRIPTS, '_': _SUBSCRIPTS}
+_MATH_SYMBOL_RE = re.compile('|'.join(map(re.escape, _MATH_SYMBOLS)))
+# Every _MATH_SYMBOLS key contains one of these; without them there is
+# nothing to replace
+_MATH_TRIGGERS = ('=', 'pi', 'ta', 'ma', 'ha')
+
+
 def process_math(text):
     """Convert simple math notation to Unicode symbols"""
-    superscripts = {'0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴', 
-                    '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹'}
-    text = re.sub(r'\^(\d)', lambda m: superscripts.get(m.group(1), m.group(1)), text)
-    
-    subscripts = {'0': '₀', '1': '₁', '2': '₂', '3': '₃', '4': '₄',
-                  '5': '₅', '6': '₆', '7': '₇', '8': '₈', '9': '₉'}
-    text = re.sub(r'_(\d)', lambda m: subscripts.get(m.group(1), m.group(1)), text)
-    
-    replacements = {
-        '<=': '≤', '>=': '≥', '!=': '≠', '~=': '≈',
-        'alpha': 'α', 'beta': 'β', 'gamma': 'γ', 'delta': 'δ',
-        'pi': 'π', 'theta': 'θ', 'sigma': 'σ'
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+    if '^' in text or '_' in text:
+        text = _SCRIPT_RE.sub(
+            lambda m: _SCRIPT_DIGITS[m.group(1)].get(m.group(2), m.group(2)), text)
     
-    return text
+    if not any(trigger in text for trigger in _MATH_TRIGGERS):
+        return text
+    
+    # One pass for all symbol names instead of a str.replace per entry
+    return _MATH_SYMBOL_RE.sub(lambda m: _MATH_SYMBOLS[m.group()], text)
 
 
 # === VALIDATION ===
+# Slide sections that hold visible content (notes excluded)
+_CONTENT_KEYS = ("content", "left", "right",
+                 "left_top", "right_top", "left_bottom", "right_bottom")
+
+
 def validate_slide(slide_data, slide_num, config):
     """Validate slide data"""
     issues = []
@@ -170,11 +246,7 @@ def validate_slide(slide_data, slide_num, config):
     elif len(slide_data["title"]) > 100:
         issues.append(f"Slide {slide_num}: Title very long ({len(slide_data['title'])} chars)")
     
-    has_content = any([
-        slide_data["content"], slide_data["left"], slide_data["right"],
-        slide_data["left_top"], slide_data["right_top"],
-        slide_data["left_bottom"], slide_data["right_bottom"]
-    ])
+    has_content = any(slide_data[key] for key in _CONTENT_KEYS)
     
     if not has_content:
         issues.append(f"Slide {slide_num}: No content defined")
@@ -183,6 +255,17 @@ def validate_slide(slide_data, slide_num, config):
 
 
 # === ADD TEXTBOX ===
+EMU_PER_INCH = 914400
+
+
+def copy_paragraph_format(paragraph, pPr):
+    """Give a paragraph a copy of another paragraph's <a:pPr> formatting"""
+    p_element = paragraph._p
+    if p_element.pPr is not None:
+        p_element.remove(p_element.pPr)
+    p_element.insert(0, deepcopy(pPr))
+
+
 def add_textbox(slide, left, top, width, height, lines, font_size=22, label=None, 
                 config=None, v_align=MSO_ANCHOR.TOP):
     """Enhanced textbox with overflow detection, list formatting, and styling"""
@@ -192,15 +275,18 @@ def add_textbox(slide, left, top, width, height, lines, font_size=22, label=None
     if config is None:
         config = DEFAULT_CONFIG
     
-    joined = " ".join(lines)
-    joined = process_math(joined)
-    text_length = len(joined)
+    # Math notation is converted once per line and reused for the
+    # overflow estimate and the paragraphs below
+    processed = [process_math(line) for line in lines]
+    # Length of the lines joined by single spaces, without joining them
+    text_length = sum(map(len, processed)) + len(processed) - 1
     
     # Overflow detection
     if config.get("enable_overflow_warnings", True):
         try:
-            w = width.inches if hasattr(width, 'inches') else width
-            h = height.inches if hasattr(height, 'inches') else height
+            joined = " ".join(processed)
+            w = width / EMU_PER_INCH if isinstance(width, int) else width
+            h = height / EMU_PER_INCH if isinstance(height, int) else height
             overflow, needed, available = check_text_overflow(joined, font_size, w, h)
             if overflow:
                 print(f"⚠️  Potential overflow in '{label}': needs {needed} lines, has {available}")
@@ -218,8 +304,7 @@ def add_textbox(slide, left, top, width, height, lines, font_size=22, label=None
         font_size = min(font_size, 12)
     
     # Handle [step] animations
-    step_lines = [l for l in lines if "[step]" in l.lower()]
-    if step_lines:
+    if any(_STEP_TAG_RE.search(l) for l in lines):
         return add_step_textboxes(slide, left, top, width, lines, font_size, label, config)
     
     # Detect list formatting
@@ -234,14 +319,23 @@ def add_textbox(slide, left, top, width, height, lines, font_size=22, label=None
     tf.word_wrap = True
     tf.vertical_anchor = v_align
     
+    # Paragraph formatting shared by every line in this box
+    font_name = config["font_name"]
+    default_size = Pt(font_size)
+    default_color = rgb_color(*config["text_color"])
+    space_after = Pt(3) if text_length > 300 else Pt(6)
+    
+    # The first paragraph of each style is formatted through python-pptx;
+    # later ones get a copy of its <a:pPr> instead of repeating the setters
+    formatted_pPr = {}
+    
     # Add content
     first = True
-    for item in lines:
+    for item in processed:
         if not item.strip():
             continue
         
         style, text = parse_styled_text(item)
-        text = process_math(text)
         
         if first:
             p = tf.paragraphs[0]
@@ -251,40 +345,51 @@ def add_textbox(slide, left, top, width, height, lines, font_size=22, label=None
         
         if is_list:
             text = clean_bullet_marker(text)
-            p.level = 0
-            p.text = text
-        else:
-            p.text = text
+        p.text = text
+        
+        pPr = formatted_pPr.get(style)
+        if pPr is not None:
+            copy_paragraph_format(p, pPr)
+            continue
         
-        p.font.name = config["font_name"]
+        if is_list:
+            p.level = 0
+        p.font.name = font_name
         if style:
             apply_style(p, style, config)
         else:
-            p.font.size = Pt(font_size)
-            p.font.color.rgb = RGBColor(*config["text_color"])
+            p.font.size = default_size
+            p.font.color.rgb = default_color
         
-        if text_length > 300:
-            p.space_after = Pt(3)
-        else:
-            p.space_after = Pt(6)
+        p.space_after = space_after
+        formatted_pPr[style] = p._p.pPr
     
     return box
 
 
+# [step] boxes: fixed height, stacked at a fixed pitch
+_STEP_BOX_HEIGHT = Inches(0.6)
+_STEP_BOX_SPACING = Inches(0.65)
+_STEP_TAG_RE = re.compile(r'\[step\]\s*', re.IGNORECASE)
+
+
 def add_step_textboxes(slide, left, top, width, lines, font_size, label, config):
     """Create separate textboxes for each [step] line"""
     top_offset = top
     boxes = []
+    font_name = config["font_name"]
+    default_size = Pt(font_size)
+    default_color = rgb_color(*config["text_color"])
     
     for i, item in enumerate(lines):
         if not item.strip():
             continue
         
-        text = re.sub(r'\[step\]\s*', '', item, flags=re.IGNORECASE)
+        text = _STEP_TAG_RE.sub('', item)
         text = process_math(text)
         style, text = parse_styled_text(text)
         
-        box = slide.shapes.add_textbox(left, top_offset, width, Inches(0.6))
+        box = slide.shapes.add_textbox(left, top_offset, width, _STEP_BOX_HEIGHT)
         if label:
             box.name = f"{label}_Step{i+1}"
         
@@ -292,124 +397,157 @@ def add_step_textboxes(slide, left, top, width, lines, font_size, label, config)
         tf.word_wrap = True
         p = tf.paragraphs[0]
         p.text = text
-        p.font.name = config["font_name"]
+        p.font.name = font_name
         
         if style:
             apply_style(p, style, config)
         else:
-            p.font.size = Pt(font_size)
-            p.font.color.rgb = RGBColor(*config["text_color"])
+            p.font.size = default_size
+            p.font.color.rgb = default_color
         
         boxes.append(box)
-        top_offset += Inches(0.65)
+        top_offset += _STEP_BOX_SPACING
     
     return boxes
 
 
 # === ADD SLIDE NUMBER ===
+_FOOTER_WIDTH = Inches(1)
+_FOOTER_HEIGHT = Inches(0.3)
+_FOOTER_FONT_SIZE = Pt(12)
+_FOOTER_COLOR = RGBColor(128, 128, 128)
+
+
 def add_slide_number(slide, slide_num, total_slides, config):
     """Add slide number footer"""
+    add_slide_number_footer(slide, slide_num, total_slides,
+                            Inches(config["slide_width"] - 1.5),
+                            Inches(config["slide_height"] - 0.5))
+
+
+def add_slide_number_footer(slide, slide_num, total_slides, left, top, template=None):
+    """Add slide number footer at left/top; returns its <p:sp> for reuse as the next template"""
     footer_text = f"{slide_num} / {total_slides}"
     
-    footer = slide.shapes.add_textbox(
-        Inches(config["slide_width"] - 1.5),
-        Inches(config["slide_height"] - 0.5),
-        Inches(1),
-        Inches(0.3)
-    )
+    if template is not None:
+        # Same box and formatting as the template: copy it and patch id, name and text.
+        # python-pptx has no public API for inserting a copied shape, so this uses
+        # its private _next_shape_id and _spTree (as of python-pptx 1.0.x); going
+        # through add_textbox would redo every font/colour/alignment setter per slide
+        sp = deepcopy(template)
+        shape_id = slide.shapes._next_shape_id
+        sp.nvSpPr.cNvPr.id = shape_id
+        sp.nvSpPr.cNvPr.name = f"TextBox {shape_id - 1}"
+        sp.xpath("./p:txBody/a:p/a:r/a:t")[0].text = footer_text
+        slide.shapes._spTree.insert_element_before(sp, "p:extLst")
+        return template
+    
+    footer = slide.shapes.add_textbox(left, top, _FOOTER_WIDTH, _FOOTER_HEIGHT)
     
     tf = footer.text_frame
     p = tf.paragraphs[0]
     p.text = footer_text
-    p.font.size = Pt(12)
-    p.font.color.rgb = RGBColor(128, 128, 128)
+    p.font.size = _FOOTER_FONT_SIZE
+    p.font.color.rgb = _FOOTER_COLOR
     p.alignment = PP_ALIGN.RIGHT
+    return footer._element
 
 
 # === PARSER ===
-def parse_content_file(filename):
-    """Parse content file"""
-    slides = []
-    current = {
+# "Keyword:" line prefixes that open a list section
+_SECTION_KEYWORDS = {
+    "Content": "content", "Left": "left", "Right": "right",
+    "LeftTop": "left_top", "RightTop": "right_top",
+    "LeftBottom": "left_bottom", "RightBottom": "right_bottom",
+    "Notes": "notes"
+}
+# A LeftBottom line numbered "1.", "2." or "3." holds several questions
+_NUMBERED_QUESTION_RE = re.compile(r'[123]\.')
+
+
+def new_slide():
+    """Empty slide record as produced by the parser"""
+    return {
         "title": "", "content": [], "notes": [],
         "left": [], "right": [],
         "left_top": [], "right_top": [],
         "left_bottom": [], "right_bottom": [],
         "template": None
     }
+
+
+def slide_layout(slide):
+    """Layout of a slide dict: reading, four_box, two_column or single"""
+    left_top, right_top = slide.get("left_top"), slide.get("right_top")
+    left_bottom, right_bottom = slide.get("left_bottom"), slide.get("right_bottom")
+    if left_top and left_bottom and not (right_top or right_bottom):
+        return "reading"
+    if left_top or right_top or left_bottom or right_bottom:
+        return "four_box"
+    if slide.get("left") or slide.get("right"):
+        return "two_column"
+    return "single"
+
+
+def parse_content_file(filename):
+    """Parse content file (a path or an open text stream)"""
+    slides = []
+    current = new_slide()
     section = None
 
-    with open(filename, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.rstrip()
-            
-            if not line or line == "---":
-                continue
+    if hasattr(filename, "read"):
+        lines = filename.read().splitlines()
+    else:
+        with open(filename, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
 
-            if line.startswith("Slide "):
-                if current["title"]:
-                    slides.append(current)
-                    current = {
-                        "title": "", "content": [], "notes": [],
-                        "left": [], "right": [],
-                        "left_top": [], "right_top": [],
-                        "left_bottom": [], "right_bottom": [],
-                        "template": None
-                    }
-                section = None
-                continue
+    for line in lines:
+        line = line.rstrip()
+        
+        if not line or line == "---":
+            continue
 
-            if line.startswith("Template:"):
-                current["template"] = line.replace("Template:", "").strip()
-                continue
+        if line.startswith("Slide "):
+            if current["title"]:
+                current["layout"] = slide_layout(current)
+                slides.append(current)
+                current = new_slide()
+            section = None
+            continue
 
-            if line.startswith("Title:"):
-                current["title"] = line.replace("Title:", "").strip()
-                section = None
+        keyword, sep, value = line.partition(":")
+        if not sep:
+            text = line
+        elif keyword == "Template":
+            current["template"] = value.strip()
+            continue
+        elif keyword == "Title":
+            current["title"] = value.strip()
+            section = None
+            continue
+        elif keyword in _SECTION_KEYWORDS:
+            section = _SECTION_KEYWORDS[keyword]
+            text = value.strip()
+            if section == "left_bottom" and _NUMBERED_QUESTION_RE.search(text):
+                questions = split_questions(text)
+                current["left_bottom"].extend(questions)
                 continue
-            elif line.startswith("Content:"):
-                section = "content"
-                text = line.replace("Content:", "").strip()
-            elif line.startswith("Left:"):
-                section = "left"
-                text = line.replace("Left:", "").strip()
-            elif line.startswith("Right:"):
-                section = "right"
-                text = line.replace("Right:", "").strip()
-            elif line.startswith("LeftTop:"):
-                section = "left_top"
-                text = line.replace("LeftTop:", "").strip()
-            elif line.startswith("RightTop:"):
-                section = "right_top"
-                text = line.replace("RightTop:", "").strip()
-            elif line.startswith("LeftBottom:"):
-                section = "left_bottom"
-                text = line.replace("LeftBottom:", "").strip()
-                if any(q in text for q in ["1.", "2.", "3."]):
-                    questions = split_questions(text)
-                    current["left_bottom"].extend(questions)
-                    continue
-            elif line.startswith("RightBottom:"):
-                section = "right_bottom"
-                text = line.replace("RightBottom:", "").strip()
-            elif line.startswith("Notes:"):
-                section = "notes"
-                text = line.replace("Notes:", "").strip()
-            else:
-                text = line
+        else:
+            text = line
 
-            if section in current and text:
-                current[section].append(text)
+        if section in current and text:
+            current[section].append(text)
 
-        if current["title"]:
-            slides.append(current)
+    if current["title"]:
+        current["layout"] = slide_layout(current)
+        slides.append(current)
 
     return slides
 
 
 # === BUILD PRESENTATION ===
 def build_presentation(slides, output_name, config=None):
-    """Build presentation with custom styling"""
+    """Build presentation with custom styling (to a path or a binary stream)"""
     if config is None:
         config = DEFAULT_CONFIG
     
@@ -428,93 +566,126 @@ def build_presentation(slides, output_name, config=None):
     COLUMN_GAP = Inches(0.4)
     ROW_GAP = Inches(0.3)
     COLUMN_WIDTH = (CONTENT_WIDTH - COLUMN_GAP) / 2
+    FOOTER_LEFT = Inches(config["slide_width"] - 1.5)
+    FOOTER_TOP = Inches(config["slide_height"] - 0.5)
+    TITLE_HEIGHT = Inches(0.8)
+    TITLE_FONT_NAME = config.get("title_font_name", config["font_name"])
+    TITLE_FONT_SIZE = Pt(32)
+    TITLE_COLOR = rgb_color(*config["title_color"])
+    RIGHT_COLUMN_LEFT = CONTENT_LEFT + COLUMN_WIDTH + COLUMN_GAP
+    READING_HEIGHT = CONTENT_HEIGHT * 0.65
+    QUESTIONS_HEIGHT = CONTENT_HEIGHT * 0.35 - ROW_GAP
+    QUESTIONS_TOP = CONTENT_TOP + READING_HEIGHT + ROW_GAP
+    HALF_HEIGHT = (CONTENT_HEIGHT - ROW_GAP) / 2
+    BOTTOM_ROW_TOP = CONTENT_TOP + HALF_HEIGHT + ROW_GAP
+    BOX_FONT_SIZE = 18
+    show_slide_numbers = config.get("enable_slide_numbers", True)
     
     total_slides = len(slides)
+    footer_template = None
+    title_pPr = None
+    
+    blank_layout = prs.slide_layouts[6]
+    use_background_image = bool(config.get("background_image")
+                                and os.path.exists(config["background_image"]))
+    if not use_background_image:
+        # Solid color background, set once on the layout and inherited by every slide
+        fill = blank_layout.background.fill
+        fill.solid()
+        fill.fore_color.rgb = rgb_color(*config.get("background_color", [255, 255, 255]))
     
     for idx, s in enumerate(slides, start=1):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide = prs.slides.add_slide(blank_layout)
         
         # Background
-        if config.get("background_image") and os.path.exists(config["background_image"]):
+        if use_background_image:
             slide.shapes.add_picture(config["background_image"], 0, 0,
                                     width=SLIDE_WIDTH, height=SLIDE_HEIGHT)
-        else:
-            # Solid color background
-            background = slide.background
-            fill = background.fill
-            fill.solid()
-            fill.fore_color.rgb = RGBColor(*config.get("background_color", [255, 255, 255]))
         
         # Title
-        title_box = slide.shapes.add_textbox(TITLE_LEFT, TITLE_TOP, CONTENT_WIDTH, Inches(0.8))
+        title_box = slide.shapes.add_textbox(TITLE_LEFT, TITLE_TOP, CONTENT_WIDTH, TITLE_HEIGHT)
         tf = title_box.text_frame
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
         p = tf.paragraphs[0]
         p.text = s["title"]
-        p.font.name = config.get("title_font_name", config["font_name"])
-        p.font.size = Pt(32)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(*config["title_color"])
+        if title_pPr is None:
+            p.font.name = TITLE_FONT_NAME
+            p.font.size = TITLE_FONT_SIZE
+            p.font.bold = True
+            p.font.color.rgb = TITLE_COLOR
+            title_pPr = p._p.pPr
+        else:
+            # Later titles copy the first title's formatting
+            copy_paragraph_format(p, title_pPr)
         
-        # Layout logic
-        if s["left_top"] and s["left_bottom"] and not (s["right_top"] or s["right_bottom"]):
+        # Layout logic; always worked out from the sections, since a "layout"
+        # tag can be missing or stale once a slide has been edited
+        layout = slide_layout(s)
+        if layout == "reading":
             # Reading slide
-            reading_height = CONTENT_HEIGHT * 0.65
-            questions_height = CONTENT_HEIGHT * 0.35 - ROW_GAP
-            
             add_textbox(slide, CONTENT_LEFT, CONTENT_TOP,
-                       CONTENT_WIDTH, reading_height, s["left_top"], 
+                       CONTENT_WIDTH, READING_HEIGHT, s["left_top"], 
                        label="ReadingText", config=config, v_align=MSO_ANCHOR.TOP)
-            add_textbox(slide, CONTENT_LEFT, CONTENT_TOP + reading_height + ROW_GAP,
-                       CONTENT_WIDTH, questions_height, s["left_bottom"], 
+            add_textbox(slide, CONTENT_LEFT, QUESTIONS_TOP,
+                       CONTENT_WIDTH, QUESTIONS_HEIGHT, s["left_bottom"], 
                        label="ReadingQuestions", config=config, v_align=MSO_ANCHOR.TOP)
         
-        elif any([s["left_top"], s["right_top"], s["left_bottom"], s["right_bottom"]]):
+        elif layout == "four_box":
             # 4-box slide
-            half_height = (CONTENT_HEIGHT - ROW_GAP) / 2
-            box_font_size = 18
-            
-            add_textbox(slide, CONTENT_LEFT, CONTENT_TOP,
-                       COLUMN_WIDTH, half_height, s["left_top"], 
-                       font_size=box_font_size, label="LeftTop", config=config)
-            add_textbox(slide, CONTENT_LEFT + COLUMN_WIDTH + COLUMN_GAP, CONTENT_TOP,
-                       COLUMN_WIDTH, half_height, s["right_top"], 
-                       font_size=box_font_size, label="RightTop", config=config)
-            add_textbox(slide, CONTENT_LEFT, CONTENT_TOP + half_height + ROW_GAP,
-                       COLUMN_WIDTH, half_height, s["left_bottom"], 
-                       font_size=box_font_size, label="LeftBottom", config=config)
-            add_textbox(slide, CONTENT_LEFT + COLUMN_WIDTH + COLUMN_GAP,
-                       CONTENT_TOP + half_height + ROW_GAP,
-                       COLUMN_WIDTH, half_height, s["right_bottom"], 
-                       font_size=box_font_size, label="RightBottom", config=config)
+            # Empty boxes are skipped here rather than inside add_textbox
+            if s["left_top"]:
+                add_textbox(slide, CONTENT_LEFT, CONTENT_TOP,
+                           COLUMN_WIDTH, HALF_HEIGHT, s["left_top"], 
+                           font_size=BOX_FONT_SIZE, label="LeftTop", config=config)
+            if s["right_top"]:
+                add_textbox(slide, RIGHT_COLUMN_LEFT, CONTENT_TOP,
+                           COLUMN_WIDTH, HALF_HEIGHT, s["right_top"], 
+                           font_size=BOX_FONT_SIZE, label="RightTop", config=config)
+            if s["left_bottom"]:
+                add_textbox(slide, CONTENT_LEFT, BOTTOM_ROW_TOP,
+                           COLUMN_WIDTH, HALF_HEIGHT, s["left_bottom"], 
+                           font_size=BOX_FONT_SIZE, label="LeftBottom", config=config)
+            if s["right_bottom"]:
+                add_textbox(slide, RIGHT_COLUMN_LEFT, BOTTOM_ROW_TOP,
+                           COLUMN_WIDTH, HALF_HEIGHT, s["right_bottom"], 
+                           font_size=BOX_FONT_SIZE, label="RightBottom", config=config)
         
-        elif s["left"] or s["right"]:
+        elif layout == "two_column":
             # Two-column layout
-            add_textbox(slide, CONTENT_LEFT, CONTENT_TOP,
-                       COLUMN_WIDTH, CONTENT_HEIGHT, s["left"], 
-                       label="Left", config=config)
-            add_textbox(slide, CONTENT_LEFT + COLUMN_WIDTH + COLUMN_GAP, CONTENT_TOP,
-                       COLUMN_WIDTH, CONTENT_HEIGHT, s["right"], 
-                       label="Right", config=config)
+            if s["left"]:
+                add_textbox(slide, CONTENT_LEFT, CONTENT_TOP,
+                           COLUMN_WIDTH, CONTENT_HEIGHT, s["left"], 
+                           label="Left", config=config)
+            if s["right"]:
+                add_textbox(slide, RIGHT_COLUMN_LEFT, CONTENT_TOP,
+                           COLUMN_WIDTH, CONTENT_HEIGHT, s["right"], 
+                           label="Right", config=config)
         
-        else:
+        elif s["content"]:
             # Single-column content
             add_textbox(slide, CONTENT_LEFT, CONTENT_TOP,
                        CONTENT_WIDTH, CONTENT_HEIGHT, s["content"], 
                        label="Content", config=config)
         
         # Add slide numbers
-        if config.get("enable_slide_numbers", True):
-            add_slide_number(slide, idx, total_slides, config)
+        if show_slide_numbers:
+            footer_template = add_slide_number_footer(slide, idx, total_slides,
+                                                      FOOTER_LEFT, FOOTER_TOP, footer_template)
         
         # Notes
         if s["notes"]:
             notes_slide = slide.notes_slide
             notes_tf = notes_slide.notes_text_frame
-            for note in s["notes"]:
-                notes_tf.add_paragraph().text = f"• {note}"
+            # One assignment; the leading "\n" keeps the placeholder's empty first paragraph
+            notes_tf.text = "\n" + "\n".join(f"• {note}" for note in s["notes"])
     
-    prs.save(output_name)
+    if hasattr(output_name, "write"):
+        prs.save(output_name)
+        return
+
+    # One large buffer instead of many small writes while zipping the parts
+    with open(output_name, "wb", buffering=1 << 20) as f:
+        prs.save(f)
     print(f"✅ Presentation created: {output_name}")
 
 
@@ -529,7 +700,7 @@ if __name__ == "__main__":
     
     config = DEFAULT_CONFIG
     if config_file and os.path.exists(config_file):
-        with open(config_file, 'r') as f:
+        with open(config_file, 'r', encoding='utf-8') as f:
             user_config = json.load(f)
             config = merge_config(user_config)
     
@@ -4,27 +4,37 @@ Slide Preview Generator
 Creates visual thumbnails of slides with correct colors, fonts, and backgrounds
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
 from PIL import Image
+import contextlib
+import functools
+import hashlib
 import io
+import json
+import os
+import re
 import textwrap
+import threading
+from collections import OrderedDict, namedtuple
+
+from generate_presentation_universal import slide_layout
 
 
 def hex_to_rgb_norm(hex_color):
     """Convert hex to normalized RGB (0-1 range) for matplotlib"""
     if isinstance(hex_color, list):
         return [c/255 for c in hex_color]
-    hex_color = hex_color.lstrip('#')
-    rgb = [int(hex_color[i:i+2], 16) for i in (0, 2, 4)]
+    rgb = bytes.fromhex(hex_color.lstrip('#')[:6])
     return [c/255 for c in rgb]
 
 
+_STYLE_TAG_RE = re.compile(r'^\[(\w+)\]\s*(.+)')
+
+
 def parse_styled_text_preview(text):
     """Extract style and clean text for preview"""
-    import re
-    match = re.match(r'^\[(\w+)\]\s*(.+)', text)
+    match = _STYLE_TAG_RE.match(text)
     if match:
         return match.group(1), match.group(2)
     return None, text
@@ -38,9 +48,75 @@ def get_style_color(style, config):
     return hex_to_rgb_norm(config.get("text_color", [64, 64, 64]))
 
 
+def get_style_colors(config):
+    """Resolve all style colors once (unknown styles use the text color)"""
+    return {style: get_style_color(style, config)
+            for style in config.get("styles", {})}
+
+
+@functools.lru_cache(maxsize=8)
+def get_text_wrapper(width):
+    """Shared TextWrapper per width (wrap() keeps no state between calls)"""
+    return textwrap.TextWrapper(width=width)
+
+
 def wrap_text(text, width=50):
     """Wrap text to specified width"""
-    return '\n'.join(textwrap.wrap(text, width=width))
+    return '\n'.join(get_text_wrapper(width).wrap(text))
+
+
+@functools.lru_cache(maxsize=16)
+def get_title_font(font_name):
+    """Title FontProperties; only generic families map, anything else is sans-serif"""
+    family = font_name.lower()
+    if family not in ('serif', 'sans-serif', 'monospace'):
+        family = 'sans-serif'
+    return FontProperties(family=family, size=20, weight='bold')
+
+
+# Config values resolved once per preview and shared by the render helpers
+PreviewContext = namedtuple("PreviewContext", [
+    "bg_color", "title_color", "title_font",
+    "text_color", "style_colors", "show_slide_numbers"
+])
+
+
+def get_preview_context(config):
+    """Resolve colors, fonts and flags from the config for one preview"""
+    title_font = config.get("title_font_name", config.get("font_name", "Arial"))
+    return PreviewContext(
+        bg_color=hex_to_rgb_norm(config.get("background_color", [255, 255, 255])),
+        title_color=hex_to_rgb_norm(config.get("title_color", [0, 0, 0])),
+        title_font=get_title_font(title_font),
+        text_color=hex_to_rgb_norm(config.get("text_color", [64, 64, 64])),
+        style_colors=get_style_colors(config),
+        show_slide_numbers=config.get("enable_slide_numbers", True)
+    )
+
+
+# One reusable figure per preview size; figures are not thread-safe, so
+# rendering holds the lock
+_PREVIEW_FIGURES = {}
+_PREVIEW_FIGURE_LOCK = threading.Lock()
+
+
+def get_preview_axes(width, height, dpi):
+    """Return an empty (figure, axes) pair for the given preview size"""
+    key = (width, height, dpi)
+    if key in _PREVIEW_FIGURES:
+        fig, ax = _PREVIEW_FIGURES[key]
+        # Drop the previous slide's artists; ax.clear() would also rebuild
+        # the hidden ticks, which costs as much as a new figure
+        for artist in [*ax.texts, *ax.images]:
+            artist.remove()
+    else:
+        # Create figure with correct aspect ratio
+        fig = Figure(figsize=(width/dpi, height/dpi), dpi=dpi)
+        ax = fig.add_subplot(111)
+        # The slide fills the whole figure, so savefig needs no tight bbox
+        fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
+        _PREVIEW_FIGURES[key] = (fig, ax)
+    return fig, ax
 
 
 def create_slide_preview(slide_data, config, width=800, height=450):
@@ -48,10 +124,15 @@ def create_slide_preview(slide_data, config, width=800, height=450):
     Create a visual preview of a slide
     Returns: PIL Image
     """
-    # Create figure with correct aspect ratio
+    with _PREVIEW_FIGURE_LOCK:
+        return render_slide_preview(slide_data, config, width, height)
+
+
+def render_slide_preview(slide_data, config, width, height):
+    """Draw a slide preview on the shared figure (caller holds the lock)"""
     dpi = 100
-    fig = Figure(figsize=(width/dpi, height/dpi), dpi=dpi)
-    ax = fig.add_subplot(111)
+    fig, ax = get_preview_axes(width, height, dpi)
+    ctx = get_preview_context(config)
     
     # Remove axes
     ax.set_xlim(0, 10)
@@ -59,34 +140,20 @@ def create_slide_preview(slide_data, config, width=800, height=450):
     ax.axis('off')
     
     # Background
-    bg_color = hex_to_rgb_norm(config.get("background_color", [255, 255, 255]))
-    
+    # Solid color comes from the savefig facecolor below, which also
+    # fills the slide area when there is no (loadable) background image
     if config.get("background_image"):
         # Try to load background image
         try:
             bg_img = Image.open(config["background_image"])
             ax.imshow(bg_img, extent=[0, 10, 0, 7.5], aspect='auto', zorder=0)
         except:
-            # Fallback to solid color
-            rect = patches.Rectangle((0, 0), 10, 7.5, 
-                                     facecolor=bg_color, 
-                                     edgecolor='none', zorder=0)
-            ax.add_patch(rect)
-    else:
-        # Solid color background
-        rect = patches.Rectangle((0, 0), 10, 7.5, 
-                                 facecolor=bg_color, 
-                                 edgecolor='none', zorder=0)
-        ax.add_patch(rect)
+            pass
     
     # Title
-    title_color = hex_to_rgb_norm(config.get("title_color", [0, 0, 0]))
-    title_font = config.get("title_font_name", config.get("font_name", "Arial"))
-    
     ax.text(1.5, 6.5, slide_data.get("title", "Untitled"), 
-            fontsize=20, fontweight='bold', 
-            color=title_color,
-            fontfamily=title_font.lower() if title_font.lower() in ['serif', 'sans-serif', 'monospace'] else 'sans-serif',
+            fontproperties=ctx.title_font,
+            color=ctx.title_color,
             verticalalignment='top',
             zorder=2)
     
@@ -94,116 +161,102 @@ def create_slide_preview(slide_data, config, width=800, height=450):
     content_left = 1.5
     content_top = 5.8
     content_width = 7
-    text_color = hex_to_rgb_norm(config.get("text_color", [64, 64, 64]))
-    body_font = config.get("font_name", "Arial")
-    
-    # Determine layout and render content
-    if slide_data.get("left_top") and slide_data.get("left_bottom") and not slide_data.get("right_top"):
-        # Reading layout (stacked)
-        render_reading_layout(ax, slide_data, config, content_left, content_top)
     
-    elif any([slide_data.get("left_top"), slide_data.get("right_top"), 
-              slide_data.get("left_bottom"), slide_data.get("right_bottom")]):
-        # 4-box layout
-        render_four_box_layout(ax, slide_data, config, content_left, content_top)
-    
-    elif slide_data.get("left") or slide_data.get("right"):
-        # Two-column layout
-        render_two_column_layout(ax, slide_data, config, content_left, content_top)
-    
-    else:
-        # Single column
-        render_single_column(ax, slide_data, config, content_left, content_top)
+    # Render content with the layout tagged by the parser
+    layout = slide_data.get("layout") or slide_layout(slide_data)
+    render = _LAYOUT_RENDERERS[layout]
+    render(ax, slide_data, config, content_left, content_top, ctx)
     
     # Slide number (if enabled)
-    if config.get("enable_slide_numbers", True):
+    if ctx.show_slide_numbers:
         ax.text(9.5, 0.3, "1 / X", 
                 fontsize=8, color=[0.5, 0.5, 0.5],
                 horizontalalignment='right',
                 zorder=2)
     
-    # Convert to image
+    # Convert to image; the PNG is decoded straight back, so skip zlib
     buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight', 
-                facecolor=bg_color, edgecolor='none')
+    fig.savefig(buf, format='png', dpi=dpi,
+                facecolor=ctx.bg_color, edgecolor='none',
+                pil_kwargs={'compress_level': 0})
     buf.seek(0)
     img = Image.open(buf)
-    plt.close(fig)
+    # Decode now: thumbnails are shared through the cache, and a lazy decode
+    # from several threads would race on the buffer
+    img.load()
     
     return img
 
 
-def render_single_column(ax, slide_data, config, left, top):
+def render_single_column(ax, slide_data, config, left, top, ctx=None):
     """Render single column content"""
-    text_color = hex_to_rgb_norm(config.get("text_color", [64, 64, 64]))
-    y_pos = top
+    if ctx is None:
+        ctx = get_preview_context(config)
+    text_color = ctx.text_color
+    style_colors = ctx.style_colors
     
-    for line in slide_data.get("content", [])[:8]:  # Limit to 8 lines for preview
-        if not line.strip():
-            continue
-        
+    lines = [line for line in slide_data.get("content", [])[:8]  # Limit to 8 lines for preview
+             if line.strip()]
+    for i, line in enumerate(lines):
         # Check for [step] marker
         line = line.replace("[step]", "").strip()
         
         # Parse style
         style, text = parse_styled_text_preview(line)
-        color = get_style_color(style, config) if style else text_color
+        color = style_colors.get(style, text_color)
         
         # Wrap and truncate
         text = wrap_text(text, width=70)
         if len(text) > 100:
             text = text[:100] + "..."
         
-        ax.text(left, y_pos, f"• {text}", 
+        ax.text(left, top - 0.5 * i, f"• {text}", 
                 fontsize=9, color=color,
                 verticalalignment='top',
                 zorder=2)
-        y_pos -= 0.5
 
 
-def render_two_column_layout(ax, slide_data, config, left, top):
+def render_two_column_layout(ax, slide_data, config, left, top, ctx=None):
     """Render two-column layout"""
-    text_color = hex_to_rgb_norm(config.get("text_color", [64, 64, 64]))
+    if ctx is None:
+        ctx = get_preview_context(config)
+    text_color = ctx.text_color
+    style_colors = ctx.style_colors
     col_width = 3.5
     gap = 0.3
     
     # Left column
-    y_pos = top
-    for line in slide_data.get("left", [])[:6]:
-        if not line.strip():
-            continue
-        
+    lines = [line for line in slide_data.get("left", [])[:6] if line.strip()]
+    for i, line in enumerate(lines):
         style, text = parse_styled_text_preview(line)
-        color = get_style_color(style, config) if style else text_color
+        color = style_colors.get(style, text_color)
         text = wrap_text(text, width=35)
         
-        ax.text(left, y_pos, text, 
+        ax.text(left, top - 0.5 * i, text, 
                 fontsize=9, color=color,
                 verticalalignment='top',
                 zorder=2)
-        y_pos -= 0.5
     
     # Right column
-    y_pos = top
     right_left = left + col_width + gap
-    for line in slide_data.get("right", [])[:6]:
-        if not line.strip():
-            continue
-        
+    lines = [line for line in slide_data.get("right", [])[:6] if line.strip()]
+    for i, line in enumerate(lines):
         style, text = parse_styled_text_preview(line)
-        color = get_style_color(style, config) if style else text_color
+        color = style_colors.get(style, text_color)
         text = wrap_text(text, width=35)
         
-        ax.text(right_left, y_pos, text, 
+        ax.text(right_left, top - 0.5 * i, text, 
                 fontsize=9, color=color,
                 verticalalignment='top',
                 zorder=2)
-        y_pos -= 0.5
 
 
-def render_four_box_layout(ax, slide_data, config, left, top):
+def render_four_box_layout(ax, slide_data, config, left, top, ctx=None):
     """Render 4-box layout"""
-    text_color = hex_to_rgb_norm(config.get("text_color", [64, 64, 64]))
+    if ctx is None:
+        ctx = get_preview_context(config)
+    text_color = ctx.text_color
+    style_colors = ctx.style_colors
     box_width = 3.5
     box_height = 2.3
     gap = 0.3
@@ -216,31 +269,30 @@ def render_four_box_layout(ax, slide_data, config, left, top):
     ]
     
     for box_left, box_top, content in boxes:
-        y_pos = box_top
-        for line in content[:4]:  # Limit to 4 lines per box
-            if not line.strip():
-                continue
-            
+        lines = [line for line in content[:4] if line.strip()]  # Limit to 4 lines per box
+        for i, line in enumerate(lines):
             style, text = parse_styled_text_preview(line)
-            color = get_style_color(style, config) if style else text_color
+            color = style_colors.get(style, text_color)
             text = wrap_text(text, width=30)
             if len(text) > 80:
                 text = text[:80] + "..."
             
-            ax.text(box_left, y_pos, text, 
+            ax.text(box_left, box_top - 0.4 * i, text, 
                     fontsize=8, color=color,
                     verticalalignment='top',
                     zorder=2)
-            y_pos -= 0.4
 
 
-def render_reading_layout(ax, slide_data, config, left, top):
+def render_reading_layout(ax, slide_data, config, left, top, ctx=None):
     """Render reading comprehension layout"""
-    text_color = hex_to_rgb_norm(config.get("text_color", [64, 64, 64]))
+    if ctx is None:
+        ctx = get_preview_context(config)
+    text_color = ctx.text_color
+    style_colors = ctx.style_colors
+    question_color = style_colors.get("question", text_color)
     
     # Reading passage (top 65%)
     passage_height = 3.5
-    y_pos = top
     
     passage_text = " ".join(slide_data.get("left_top", []))
     wrapped_passage = wrap_text(passage_text, width=80)
@@ -249,13 +301,13 @@ def render_reading_layout(ax, slide_data, config, left, top):
     if len(wrapped_passage) > 200:
         wrapped_passage = wrapped_passage[:200] + "..."
     
-    ax.text(left, y_pos, wrapped_passage, 
+    ax.text(left, top, wrapped_passage, 
             fontsize=8, color=text_color,
             verticalalignment='top',
             zorder=2)
     
     # Questions (bottom 35%)
-    y_pos = top - passage_height - 0.5
+    questions_top = top - passage_height - 0.5
     
     for i, question in enumerate(slide_data.get("left_bottom", [])[:3], 1):
         q_text = question.strip()
@@ -264,12 +316,90 @@ def render_reading_layout(ax, slide_data, config, left, top):
         
         q_text = wrap_text(q_text, width=80)
         
-        ax.text(left, y_pos, q_text, 
+        ax.text(left, questions_top - 0.5 * (i - 1), q_text, 
                 fontsize=8, 
-                color=get_style_color("question", config),
+                color=question_color,
                 verticalalignment='top',
                 zorder=2)
-        y_pos -= 0.5
+
+
+_LAYOUT_RENDERERS = {
+    "reading": render_reading_layout,
+    "four_box": render_four_box_layout,
+    "two_column": render_two_column_layout,
+    "single": render_single_column
+}
+
+
+# Rendered thumbnails, least recently used first; sessions run in separate
+# threads, so every access holds the lock
+_THUMBNAIL_CACHE = OrderedDict()
+_THUMBNAIL_CACHE_SIZE = 128
+_THUMBNAIL_CACHE_LOCK = threading.Lock()
+
+
+def to_cache_key(data):
+    """Serialize slide or config data into a hashable cache key"""
+    return json.dumps(data, sort_keys=True, default=str)
+
+
+# Bump when rendering changes so stale thumbnails on disk are not reused
+_PREVIEW_CACHE_VERSION = 2
+
+
+def get_preview_cache_dir():
+    """Directory for rendered thumbnail PNGs, or None (opt in with SLIDE_PREVIEW_CACHE_DIR)"""
+    return os.environ.get("SLIDE_PREVIEW_CACHE_DIR") or None
+
+
+def load_or_render_thumbnail(key, slide, config, width, height):
+    """Load a thumbnail from the disk cache, rendering and storing it on a miss"""
+    cache_dir = get_preview_cache_dir()
+    if cache_dir is None:
+        return create_slide_preview(slide, config, width=width, height=height)
+    
+    digest = hashlib.blake2b("\0".join(map(str, (_PREVIEW_CACHE_VERSION, *key))).encode("utf-8"),
+                             digest_size=16).hexdigest()
+    path = os.path.join(cache_dir, digest + ".png")
+    
+    try:
+        thumb = Image.open(path)
+        thumb.load()
+        return thumb
+    except OSError:
+        pass
+    
+    thumb = create_slide_preview(slide, config, width=width, height=height)
+    # Write under a temporary name so readers never see a partial file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        thumb.save(tmp_path, format='PNG')
+        os.replace(tmp_path, path)
+    except OSError:
+        # Caching is best effort (e.g. read-only cache directory), but do not
+        # leave a partial temporary file behind
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+    return thumb
+
+
+def get_cached_thumbnail(slide, config_key, config, width, height):
+    """Render a slide thumbnail, reusing it while slide and config are unchanged"""
+    key = (to_cache_key(slide), config_key, width, height)
+    with _THUMBNAIL_CACHE_LOCK:
+        thumb = _THUMBNAIL_CACHE.get(key)
+        if thumb is not None:
+            _THUMBNAIL_CACHE.move_to_end(key)
+            return thumb
+    
+    # Render outside the lock so other sessions can still hit the cache
+    thumb = load_or_render_thumbnail(key, slide, config, width, height)
+    with _THUMBNAIL_CACHE_LOCK:
+        _THUMBNAIL_CACHE[key] = thumb
+        if len(_THUMBNAIL_CACHE) > _THUMBNAIL_CACHE_SIZE:
+            _THUMBNAIL_CACHE.popitem(last=False)
+    return thumb
 
 
 def create_thumbnail_grid(slides, config, cols=3):
@@ -291,6 +421,11 @@ def create_thumbnail_grid(slides, config, cols=3):
     grid_height = rows * thumb_height + (rows + 1) * padding
     
     grid_img = Image.new('RGB', (grid_width, grid_height), color=(240, 240, 240))
+    config_key = to_cache_key(config)
+    background = config.get("background_image")
+    if background and os.path.exists(background):
+        # A replaced background file must not reuse old thumbnails
+        config_key += f"@{os.path.getmtime(background)}"
     
     for idx, slide in enumerate(slides[:12]):  # Max 12 thumbnails
         row = idx // cols
@@ -300,7 +435,7 @@ def create_thumbnail_grid(slides, config, cols=3):
         y = row * thumb_height + (row + 1) * padding
         
         # Generate thumbnail
-        thumb = create_slide_preview(slide, config, width=thumb_width, height=thumb_height)
+        thumb = get_cached_thumbnail(slide, config_key, config, thumb_width, thumb_height)
         grid_img.paste(thumb, (x, y))
     
     return grid_img
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+Tests for the universal generator
+"""
+
+import ast
+from pathlib import Path
+
+from pptx import Presentation
+
+from generate_presentation_universal import DEFAULT_CONFIG, build_presentation, new_slide
+
+
+def test_two_column_deck_from_new_slide(tmp_path):
+    """A hand-built slide with Left/Right content gets both columns"""
+    slide = new_slide()
+    slide["title"] = "Vocabulary"
+    slide["left"] = ["term one"]
+    slide["right"] = ["first definition"]
+    output = tmp_path / "deck.pptx"
+
+    build_presentation([slide], str(output))
+
+    texts = [shape.text_frame.text for shape in Presentation(str(output)).slides[0].shapes
+             if shape.has_text_frame]
+    assert "term one" in texts
+    assert "first definition" in texts
+
+
+def test_app_defaults_match_generator():
+    """The web app's copy of the defaults (kept to avoid importing pptx) has not drifted"""
+    source = (Path(__file__).parent / "streamlit_app_universal.py").read_text(encoding="utf-8")
+    app_defaults = next(
+        ast.literal_eval(node.value) for node in ast.parse(source).body
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "_DEFAULT_CONFIG"
+    )
+    assert app_defaults == DEFAULT_CONFIG